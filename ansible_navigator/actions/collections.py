@@ -19,11 +19,14 @@ from . import _actions as actions
 from ..app import App
 from ..app_public import AppPublic
 from ..steps import Step
+from ..utils import get_and_check_collection_doc_cache
 
 from ..ui_framework import CursesLinePart
 from ..ui_framework import CursesLines
 from ..ui_framework import Interaction
 
+COLLECTION_DOC_CACHE_FNAME = "collection_doc_cache.db"
+
 
 def color_menu(colno: int, colname: str, entry: Dict[str, Any]) -> int:
     # pylint: disable=unused-argument
@@ -88,8 +91,13 @@ class Action(App):
         self._calling_app: AppPublic
         self._collections: List = []
         self._stats: Dict = {}
-        self._collection_cache = args.collection_doc_cache
-        self._collection_cache_path = args.collection_doc_cache.path
+        # only checked when the collections action is used, not on every startup
+        messages, self._collection_cache = get_and_check_collection_doc_cache(
+            args, COLLECTION_DOC_CACHE_FNAME
+        )
+        for message in messages:
+            self._logger.debug(message)
+        self._collection_cache_path = self._collection_cache.path
         self._adjacent_collection_dir: str
         self._parser_error: str = ""
 
@@ -136,8 +144,8 @@ class Action(App):
             )
             # assume this is a provided param
             self._args.execution_environment = True
-            for message in messages:
-                self._logger.debug(message)
+            for message, message_args in messages:
+                self._logger.debug(message, *message_args)
             for key, value in vars(self._args).items():
                 self._logger.debug("Running with %s=%s %s", key, value, type(value))
             if self._parser_error:
@@ -6,7 +6,7 @@ from ..app_public import AppPublic
 from ..ui_framework import Interaction
 from ..ui_framework import dict_to_form
 from ..ui_framework import form_to_dict
-from ..yaml import yaml
+from ..yaml import yaml, SafeLoader
 
 FORM = """
 form:
@@ -104,7 +104,7 @@ class Action:
         :type app: App
         """
         self._logger.debug("sample form requested")
-        form_data = yaml.safe_load(FORM)
+        form_data = yaml.load(FORM, Loader=SafeLoader)
         form = dict_to_form(form_data["form"])
         interaction.ui.show(form)
         as_dict = form_to_dict(form)
@@ -96,8 +96,8 @@ class App:
             self._logger.error(self._parser_error)
             return None
 
-        for msg in msgs:
-            self._logger.debug(msg)
+        for msg, msg_args in msgs:
+            self._logger.debug(msg, *msg_args)
 
         if not hasattr(new_args, "requires_ansible") or new_args.requires_ansible:
             if not new_args.execution_environment:
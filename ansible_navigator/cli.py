@@ -1,5 +1,7 @@
 """ start here
 """
+import copy
+import importlib
 import json
 import logging
 import os
@@ -10,14 +12,20 @@ import time
 
 from argparse import Namespace
 from curses import wrapper
+from functools import lru_cache
 from functools import partial
+from types import ModuleType
+from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from yaml.scanner import ScannerError
 
-from .cli_args import CliArgs
+from .cli_args import get_parser
 from .config import ARGPARSE_TO_CONFIG
 from .config import NavigatorConfig
 from .action_runner import ActionRunner
@@ -25,8 +33,6 @@ from .action_runner import ActionRunner
 from .utils import check_for_ansible
 from .utils import env_var_is_file_path
 from .utils import error_and_exit_early
-from .utils import flatten_list
-from .utils import get_and_check_collection_doc_cache
 from .utils import get_conf_path
 from .utils import set_ansible_envar
 from .utils import Sentinel
@@ -34,55 +40,192 @@ from .utils import Sentinel
 from .yaml import yaml, SafeLoader
 
 APP_NAME = "ansible_navigator"
-COLLECTION_DOC_CACHE_FNAME = "collection_doc_cache.db"
+
+# The config loaded by this process, parse_and_update is called again when
+# the interactive actions reparse their params and reuses it
+_LOADED_CONFIG: Dict[Tuple[str, int, int], Dict] = {}
+
+# The config file found in the search path, by current working directory
+_FOUND_CONFIG_PATHS: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
 
 logger = logging.getLogger(APP_NAME)
 
+_HOME = os.path.expanduser("~")
 
-def _get_share_dir() -> Optional[str]:
+# Marks an arg missing from the namespace, Sentinel already means unset
+_NOT_AN_ARG = object()
+
+# Messages gathered before the logger is set up, as (format, args) so they
+# are only formatted if the log level means they will be emitted
+LogMessage = Tuple[str, Tuple[Any, ...]]
+
+LOG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s.%(msecs)03d %(levelname)s '%(name)s.%(funcName)s' %(message)s",
+    datefmt="%y%m%d%H%M%S",
+)
+LOG_FORMATTER.converter = time.gmtime
+
+# Every level name the logging module provides, including the aliases
+LOG_LEVELS = {
+    "notset": logging.NOTSET,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARN,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "fatal": logging.FATAL,
+    "critical": logging.CRITICAL,
+}
+
+
+def _share_dir_candidates() -> Iterator[str]:
     """
-    returns datadir (e.g. /usr/share/ansible_nagivator) to use for the
-    ansible-launcher data files. First found wins.
+    yields the potential datadirs, in order of preference
     """
 
+    # Explicitly set, e.g. by a packager
+    path = os.environ.get("ANSIBLE_NAVIGATOR_SHARE_DIR")
+    if path:
+        yield path
+
     # Development path
     # We want the share directory to resolve adjacent to the directory the code lives in
     # as that's the layout in the source.
-    path = os.path.join(os.path.dirname(__file__), "..", "share", APP_NAME)
-    if os.path.exists(path):
-        return path
+    yield os.path.join(os.path.dirname(__file__), "..", "share", APP_NAME)
+
+    # Fetch these together, rather than one by one
+    userbase, datarootdir, prefix = sysconfig.get_config_vars("userbase", "datarootdir", "prefix")
 
     # ~/.local/share/APP_NAME
-    userbase = sysconfig.get_config_var("userbase")
     if userbase is not None:
-        path = os.path.join(userbase, "share", APP_NAME)
-        if os.path.exists(path):
-            return path
+        yield os.path.join(userbase, "share", APP_NAME)
 
     # /usr/share/APP_NAME  (or the venv equivalent)
-    path = os.path.join(sys.prefix, "share", APP_NAME)
-    if os.path.exists(path):
-        return path
+    yield os.path.join(sys.prefix, "share", APP_NAME)
 
     # /usr/share/APP_NAME  (or what was specified as the datarootdir when python was built)
-    datarootdir = sysconfig.get_config_var("datarootdir")
     if datarootdir is not None:
-        path = os.path.join(datarootdir, APP_NAME)
-        if os.path.exists(path):
-            return path
+        yield os.path.join(datarootdir, APP_NAME)
 
     # /usr/local/share/APP_NAME
-    prefix = sysconfig.get_config_var("prefix")
     if prefix is not None:
-        path = os.path.join(prefix, "local", "share", APP_NAME)
-        if os.path.exists(path):
+        yield os.path.join(prefix, "local", "share", APP_NAME)
+
+
+@lru_cache(maxsize=1)
+def _get_share_dir() -> Optional[str]:
+    """
+    returns datadir (e.g. /usr/share/ansible_nagivator) to use for the
+    ansible-launcher data files. First found wins.
+    The share dir doesn't move while running, so this is only resolved once.
+    """
+    for path in _share_dir_candidates():
+        if os.path.isdir(path):
             return path
 
     # No path found above
     return None
 
 
-def update_args(args: Namespace) -> List[str]:
+# Some branches here call error_and_exit_early() which doesn't return, it exits.
+# pylint: disable=inconsistent-return-statements
+def _load_config_file(config_path: str, is_json: bool) -> Dict:
+    """parse the config file, JSON is a subset of YAML and far quicker
+    to parse so try it first and fall back to YAML unless the file is
+    expected to be JSON
+    """
+    with open(config_path, "rb") as config_fh:
+        raw_config = config_fh.read()
+
+    try:
+        return json.loads(raw_config)
+    except (TypeError, ValueError) as exe:
+        if is_json:
+            msg = "Invalid JSON config found in file '{0}'." " Failed with '{1}'".format(
+                config_path, str(exe)
+            )
+            error_and_exit_early(msg)
+
+    try:
+        return yaml.load(raw_config, Loader=SafeLoader)
+    except ScannerError:
+        error_and_exit_early("Config file at {0} but failed to parse it.".format(config_path))
+
+
+def _load_config_file_cached(config_path: str) -> Tuple[List[LogMessage], Dict]:
+    """load the config file, reusing the config already loaded by this process
+    if the config file hasn't changed since.
+    It is keyed by the config file's path, mtime and size, so any change
+    to the config file invalidates it.
+    """
+    msgs: List[LogMessage] = []
+    stat_result = os.stat(config_path)
+    cache_key = (os.path.abspath(config_path), stat_result.st_mtime_ns, stat_result.st_size)
+
+    if cache_key in _LOADED_CONFIG:
+        msgs.append(("Using config already loaded from %s", (config_path,)))
+        return msgs, _LOADED_CONFIG[cache_key]
+    # only the most recently loaded config is kept
+    _LOADED_CONFIG.clear()
+
+    is_json = os.path.splitext(config_path)[1].lower() == ".json"
+    if not is_json:
+        msgs.append(("Parsing config with yaml loader %s if not JSON", (SafeLoader.__name__,)))
+    config = _load_config_file(config_path, is_json)
+    _LOADED_CONFIG[cache_key] = config
+    return msgs, config
+
+
+def _as_log_messages(msgs: Sequence[str]) -> List[LogMessage]:
+    """wrap already formatted messages, they are logged as is"""
+    return [(msg, ()) for msg in msgs]
+
+
+def _expand_user(path: str) -> str:
+    """the equivalent of os.path.expanduser(path), using the
+    home directory resolved once at import for the current user
+    """
+    if path == "~" or path.startswith("~/"):
+        return _HOME.rstrip(os.sep) + path[1:] or os.sep
+    if path.startswith("~"):
+        # another user's home directory
+        return os.path.expanduser(path)
+    return path
+
+
+def _abs_user_path(path: str, cwd: str) -> str:
+    """the equivalent of os.path.abspath(os.path.expanduser(path))
+    using a current working directory resolved once by the caller
+    """
+    # most paths, e.g. those already made absolute by argparse, need no expansion
+    if path.startswith("~"):
+        path = _expand_user(path)
+    if not os.path.isabs(path):
+        path = os.path.join(cwd, path)
+    return os.path.normpath(path)
+
+
+def _flatten_args(values: List, setting: str) -> List:
+    """flatten an append argparse value and remove the default Sentinel
+    values from the settings file are usually already a flat list
+    so those are returned as is, without building a new list
+    """
+    if not isinstance(values, list):
+        error_and_exit_early(
+            f"The '{setting}' setting must be a list, found {type(values).__name__} '{values}'"
+        )
+    if Sentinel not in values and not any(isinstance(value, list) for value in values):
+        return values
+    # action="append" with nargs="+" only ever nests one level deep
+    return [
+        value
+        for entry in values
+        for value in (entry if isinstance(entry, list) else (entry,))
+        if value is not Sentinel
+    ]
+
+
+def update_args(args: Namespace) -> List[LogMessage]:
     """
     Updates args with the corresponding config values (or their defaults) unless
     explicitly specified by the user.
@@ -112,23 +255,26 @@ def update_args(args: Namespace) -> List[str]:
        and catch it by the global exception handler.
     """
 
-    msgs = []
+    msgs: List[LogMessage] = []
 
     # If no config file was parsed and added to args, there's nothing to do
     if not hasattr(args, "config") or not args.config:
-        msgs.append("No config file parsed, no default parameters to override.")
+        msgs.append(("No config file parsed, no default parameters to override.", ()))
         return msgs
 
     # Iterate through each "defaultable" (config-file-settable) path and do the
     # deed.
+    arg_values = vars(args)
+    config_get = args.config.get
     for attr, path in ARGPARSE_TO_CONFIG.items():
-        if not hasattr(args, attr):
+        arg_value = arg_values.get(attr, _NOT_AN_ARG)
+        if arg_value is _NOT_AN_ARG:
             # If the attribute doesn't exist at all, skip it.
             # This probably means it's in a subparser that isn't relevant to the
             # command currently being run by the user.
             continue
 
-        if getattr(args, attr) not in [Sentinel, [Sentinel]]:
+        if arg_value is not Sentinel and arg_value != [Sentinel]:
             # Not Sentinel means that the user specified it. Leave it alone!
             continue
 
@@ -138,8 +284,8 @@ def update_args(args: Namespace) -> List[str]:
         # doesn't exist. There's not much to do in this case, so fall back to
         # the general exception handler (whenever it exists) and let it be the
         # thing that tells the user the bad news.
-        source, value = args.config.get(path)
-        msgs.append(f"Setting arg '{attr}' to '{value}' via {source.value}")
+        source, value = config_get(path)
+        msgs.append(("Setting arg '%s' to '%s' via %s", (attr, value, source.value)))
         setattr(args, attr, value)
 
     return msgs
@@ -151,76 +297,90 @@ def setup_logger(args):
     :param args: The cli args
     :type args: argparse namespace
     """
-    if os.path.exists(args.logfile):
-        with open(args.logfile, "w"):
-            pass
-    hdlr = logging.FileHandler(args.logfile)
-    formatter = logging.Formatter(
-        fmt="%(asctime)s.%(msecs)03d %(levelname)s '%(name)s.%(funcName)s' %(message)s",
-        datefmt="%y%m%d%H%M%S",
-    )
-    formatter.converter = time.gmtime
-    hdlr.setFormatter(formatter)
+    level = LOG_LEVELS.get(args.loglevel.lower())
+    if level is None:
+        error_and_exit_early(
+            f"Unknown log level '{args.loglevel}', choose from {', '.join(LOG_LEVELS)}"
+        )
+    hdlr = logging.FileHandler(args.logfile, mode="w")
+    hdlr.setFormatter(LOG_FORMATTER)
     logger.addHandler(hdlr)
-    logger.setLevel(getattr(logging, args.loglevel.upper()))
+    logger.setLevel(level)
+
+
+def _find_config_path() -> Tuple[Optional[str], Tuple[str, ...]]:
+    """search the well known locations for a config file, the search
+    path includes the current working directory so a found config file is kept by it.
+    A kept config file is checked for again, in case it was removed since, and
+    nothing is kept when no config file is found, so one created later is picked up.
+    """
+    cwd = os.getcwd()
+    found = _FOUND_CONFIG_PATHS.get(cwd)
+    if found is not None and os.path.isfile(found[0]):
+        return found
+
+    config_path, msgs = get_conf_path(
+        "ansible-navigator", allowed_extensions=["yml", "yaml", "json"]
+    )
+    if config_path is None:
+        _FOUND_CONFIG_PATHS.pop(cwd, None)
+        return None, tuple(msgs)
+    found = _FOUND_CONFIG_PATHS[cwd] = (config_path, tuple(msgs))
+    return found
 
 
 # Some branches here call error_and_exit_early() which doesn't return, it exits.
 # pylint: disable=inconsistent-return-statements
-def setup_config() -> Tuple[List[str], NavigatorConfig]:
+def setup_config() -> Tuple[List[LogMessage], NavigatorConfig]:
     """
     Load up a configuration file, logging each step.
     Return (log messages, NavigatorConfig).
     If the config can't be found/loaded, use default settings.
     If it's found but empty or not well formed, bail out.
     """
-    pre_logger_msgs = []
+    pre_logger_msgs: List[LogMessage] = []
     config_path = None
     # Check if the conf path is set via an env var
     cfg_env_var = "ANSIBLE_NAVIGATOR_CONFIG"
     env_config_path, msgs = env_var_is_file_path(cfg_env_var, "config")
-    pre_logger_msgs += msgs
-
-    # Check well know locations
-    found_config_path, msgs = get_conf_path(
-        "ansible-navigator", allowed_extensions=["yml", "yaml", "json"]
-    )
-    pre_logger_msgs += msgs
+    pre_logger_msgs += _as_log_messages(msgs)
 
     # Pick the envar set first, followed by found, followed by leave as none
     if env_config_path is not None:
+        # the envar wins, so there's no need to search the well known locations
         config_path = env_config_path
-        pre_logger_msgs.append(f"Using config file at {config_path} set by {cfg_env_var}")
-    elif found_config_path is not None:
-        config_path = found_config_path
-        pre_logger_msgs.append(f"Using config file at {config_path} in search path")
+        pre_logger_msgs.append(("Using config file at %s set by %s", (config_path, cfg_env_var)))
     else:
-        pre_logger_msgs.append(
-            "No valid config file found, using all default values for configuration."
-        )
+        # Check well know locations
+        found_config_path, found_msgs = _find_config_path()
+        pre_logger_msgs += _as_log_messages(found_msgs)
 
-    config = {}
+        if found_config_path is not None:
+            config_path = found_config_path
+            pre_logger_msgs.append(("Using config file at %s in search path", (config_path,)))
+        else:
+            pre_logger_msgs.append(
+                ("No valid config file found, using all default values for configuration.", ())
+            )
+
+    config: Dict = {}
     if config_path is not None:
-        with open(config_path, "r") as config_fh:
-            if config_path.endswith(".json"):
-                try:
-                    config = json.load(config_fh)
-                except (TypeError, json.decoder.JSONDecodeError) as exe:
-                    msg = "Invalid JSON config found in file '{0}'." " Failed with '{1}'".format(
-                        config_fh, str(exe)
-                    )
-                    error_and_exit_early(msg)
-            else:
-                try:
-                    config = yaml.load(config_fh, Loader=SafeLoader)
-                except ScannerError:
-                    error_and_exit_early(
-                        "Config file at {0} but failed to parse it.".format(config_path)
-                    )
+        try:
+            config_msgs, config = _load_config_file_cached(config_path)
+            pre_logger_msgs += config_msgs
+        except FileNotFoundError:
+            pre_logger_msgs.append(
+                (
+                    "Config file at %s no longer exists,"
+                    " using all default values for configuration.",
+                    (config_path,),
+                )
+            )
+            config_path = None
 
     if config_path and config and config.get("ansible-navigator"):
         # If the config file was found and has the key we expect, log and use it
-        pre_logger_msgs.append("Successfully parsed config file")
+        pre_logger_msgs.append(("Successfully parsed config file", ()))
         return pre_logger_msgs, NavigatorConfig(config)
 
     if not config_path:
@@ -235,75 +395,87 @@ def setup_config() -> Tuple[List[str], NavigatorConfig]:
     )
 
 
-def parse_and_update(params: List, error_cb: Callable = None) -> Tuple[List[str], Namespace]:
+def parse_and_update(params: List, error_cb: Callable = None) -> Tuple[List[LogMessage], Namespace]:
     # pylint: disable=too-many-branches
     # pylint: disable=too-many-statements
     # pylint: disable=too-many-locals
     """parse some params and update"""
-    parser = CliArgs(APP_NAME).parser
+    parser = get_parser(APP_NAME, params)
 
     if error_cb:
+        # the parser is shared, don't leave the callback behind on it
+        parser = copy.copy(parser)
         parser.error = error_cb  # type: ignore
     args, cmdline = parser.parse_known_args(params)
     args.cmdline = cmdline
 
-    pre_logger_msgs: List[str] = []
+    pre_logger_msgs: List[LogMessage] = []
     config_msgs, config = setup_config()
     pre_logger_msgs += config_msgs
     args.config = config
     pre_logger_msgs += update_args(args)
 
-    args.logfile = os.path.abspath(os.path.expanduser(args.logfile))
+    args.logfile = os.path.abspath(_expand_user(args.logfile))
 
     # post process inventory
     if hasattr(args, "inventory"):
         # The default argparse value is [Sentinel] for default detection purposes
         # at this point it's been set to a user value so we can remove any Sentinels
-        args.inventory = [i for i in args.inventory if i is not Sentinel]
         # because the default argpars for inventory is a list, new invetories get added as a list
-        args.inventory = flatten_list(args.inventory)
-        args.inventory = [os.path.abspath(os.path.expanduser(i)) for i in args.inventory]
+        # so flatten, filter and make absolute
+        cwd = os.getcwd()
+        args.inventory = [
+            _abs_user_path(inventory, cwd)
+            for inventory in _flatten_args(args.inventory, "inventory")
+        ]
         if not args.inventory and args.app == "inventory":
             parser.error("an inventory is required when using the inventory explorer")
 
     # post process load
     if args.app == "load" and not os.path.exists(args.value):
-        parser.error(f"The file specified with load could not be found. {args.load}")
+        parser.error(f"The file specified with load could not be found. {args.value}")
 
     # post process pass_environment_variable
     if hasattr(args, "pass_environment_variable"):
-        args.pass_environment_variable = [
-            i for i in args.pass_environment_variable if i is not Sentinel
-        ]
-        args.pass_environment_variable = flatten_list(args.pass_environment_variable)
+        args.pass_environment_variable = _flatten_args(
+            args.pass_environment_variable, "pass-environment-variable"
+        )
 
     # post process playbook
     #   don't expand "" (the default)
     if hasattr(args, "playbook") and args.playbook:
-        args.playbook = os.path.abspath(os.path.expanduser(args.playbook))
+        args.playbook = os.path.abspath(_expand_user(args.playbook))
 
     # post process set_environment_variable
     if hasattr(args, "set_environment_variable"):
         # command line will be a list, settings file is a dict
         if isinstance(args.set_environment_variable, list):
-            args.set_environment_variable = [
-                i for i in args.set_environment_variable if i is not Sentinel
-            ]
-            args.set_environment_variable = flatten_list(args.set_environment_variable)
+            args.set_environment_variable = _flatten_args(
+                args.set_environment_variable, "set-environment-variable"
+            )
             set_envs = {}
             for env_var in args.set_environment_variable:
-                parts = env_var.split("=")
-                if len(parts) != 2:
+                # only split on the first =, the value may contain more
+                key, separator, value = env_var.partition("=")
+                if not key or not separator:
                     error_and_exit_early(
                         "The following set-environment-variable"
                         f" entry could not be parsed: {env_var}"
                     )
-                set_envs[parts[0]] = parts[1]
+                set_envs[key] = value
             args.set_environment_variable = set_envs
-        # coming from settings, ensure everything is a string
-        # we will json dump incase there is complext structure
+        else:
+            # coming from settings, copy so the loaded config isn't changed
+            args.set_environment_variable = dict(args.set_environment_variable)
+        # ensure everything is a string
+        # integers convert directly, we will json dump anything else
+        # incase there is complext structure and so bools become true/false
         for key, value in args.set_environment_variable.items():
-            if not isinstance(value, str):
+            if isinstance(value, str):
+                continue
+            if isinstance(value, int) and not isinstance(value, bool):
+                args.set_environment_variable[key] = str(value)
+            else:
                 args.set_environment_variable[key] = json.dumps(value)
 
     # post process welcome
@@ -318,31 +490,35 @@ def parse_and_update(params: List, error_cb: Callable = None) -> Tuple[List[str]
     else:
         error_and_exit_early("problem finding share dir")
 
-    cache_home = os.environ.get("XDG_CACHE_HOME", f"{os.path.expanduser('~')}/.cache")
+    cache_home = os.environ.get("XDG_CACHE_HOME") or f"{_HOME}/.cache"
     args.cache_dir = f"{cache_home}/{APP_NAME}"
-    msgs, args.collection_doc_cache = get_and_check_collection_doc_cache(
-        args, COLLECTION_DOC_CACHE_FNAME
-    )
-
-    pre_logger_msgs += msgs
 
     args.original_command = params
     args.parse_and_update = parse_and_update
 
-    for key, value in sorted(vars(args).items()):
-        pre_logger_msgs.append(f"Running with {key} as {value} {type(value)}")
+    # on the first parse the logger isn't set up yet, so check the requested
+    # level too, rather than formatting every arg only to throw it away
+    if logger.isEnabledFor(logging.DEBUG) or args.loglevel.lower() == "debug":
+        pre_logger_msgs.extend(
+            ("Running with %s as %s %s", (key, value, type(value)))
+            for key, value in sorted(vars(args).items())
+        )
 
     return pre_logger_msgs, args
 
 
+@lru_cache(maxsize=None)
+def _load_action(name: str) -> ModuleType:
+    """import an action module, once"""
+    return importlib.import_module(f".actions.{name}", package=__package__)
+
+
 def run(args: Namespace) -> None:
     """run the appropriate app"""
     try:
         if args.app in ["run", "config", "inventory"] and args.mode == "stdout":
             try:
-                app_action = __import__(
-                    f"actions.{args.app}", globals(), fromlist=["Action"], level=1
-                )
+                app_action = _load_action(args.app)
             except ImportError as exc:
                 msg = (
                     f"either action '{args.app}' is invalid or does not support"
@@ -368,11 +544,14 @@ def main():
     pre_logger_msgs, args = parse_and_update(sys.argv[1:])
 
     setup_logger(args)
-    for msg in pre_logger_msgs:
-        logger.debug(msg)
+    for msg, msg_args in pre_logger_msgs:
+        logger.debug(msg, *msg_args)
 
     os.environ.setdefault("ESCDELAY", "25")
-    os.system("clear")
+    if sys.stdout.isatty():
+        # home the cursor, clear the screen and scrollback without shelling out to clear(1)
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+        sys.stdout.flush()
 
     if not hasattr(args, "requires_ansible") or args.requires_ansible:
         if not args.execution_environment:
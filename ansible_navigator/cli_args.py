@@ -7,17 +7,27 @@ from argparse import _SubParsersAction
 from argparse import ArgumentParser
 from argparse import ArgumentTypeError
 from argparse import HelpFormatter
+from functools import lru_cache
+from typing import List
+from typing import Optional
+from typing import Tuple
 
-from .config import ARGPARSE_TO_CONFIG
-from .config import NavigatorConfig
+from .config import ARGPARSE_DEFAULTS
 from .utils import Sentinel
 
+# The subcommands, in the order their parsers are added
+SUBCOMMANDS = ("collections", "config", "doc", "inventory", "load", "run")
+
 
 def _abs_user_path(fpath):
     """don't overload the ap type"""
     return os.path.abspath(os.path.expanduser(fpath))
 
 
+TRUE_STRINGS = frozenset(("yes", "true", "t", "y", "1", "on"))
+FALSE_STRINGS = frozenset(("no", "false", "f", "n", "0", "off"))
+
+
 def str2bool(value):
     """convert some commonly used values
     to a boolean
@@ -26,9 +36,12 @@ def str2bool(value):
     #     return value
     if isinstance(value, bool):
         return value
-    if value.lower() in ("yes", "true", "t", "y", "1"):
+    if not isinstance(value, str):
+        raise ArgumentTypeError("Boolean value expected.")
+    value = value.lower()
+    if value in TRUE_STRINGS:
         return True
-    if value.lower() in ("no", "false", "f", "n", "0"):
+    if value in FALSE_STRINGS:
         return False
     raise ArgumentTypeError("Boolean value expected.")
 
@@ -62,19 +75,11 @@ class ArgumentParserDefaultFromConfig(ArgumentParser):
     in sync
     """
 
-    def __init__(self, *args, **kwargs):
-        self.navigator_config = NavigatorConfig(ARGPARSE_TO_CONFIG)
-        super().__init__(*args, **kwargs)
-
     def add_argument(self, *args, **kwargs):
         """add the default to the help"""
         arg_dest = kwargs.get("dest")
-        if arg_dest is not None:
-            mapped_to = ARGPARSE_TO_CONFIG.get(arg_dest)
-            if all((mapped_to, kwargs.get("help"))):
-                _config_source, default_value = self.navigator_config.get(mapped_to)
-                if not isinstance(default_value, Sentinel):
-                    kwargs["help"] += f" (default: {default_value})"
+        if arg_dest in ARGPARSE_DEFAULTS and kwargs.get("help"):
+            kwargs["help"] += f" (default: {ARGPARSE_DEFAULTS[arg_dest]})"
         super().add_argument(*args, **kwargs)
 
 
@@ -82,7 +87,11 @@ class CliArgs:
     """Build the args"""
 
     # pylint: disable=too-few-public-methods
-    def __init__(self, app_name: str):
+    def __init__(self, app_name: str, subcommands: Tuple[str, ...] = ()):
+        """
+        :param app_name: The name of the application
+        :param subcommands: Only build the parsers for these subcommands, all if empty
+        """
 
         self._app_name = app_name
         self._base_parser = ArgumentParserDefaultFromConfig(add_help=False)
@@ -97,12 +106,10 @@ class CliArgs:
             dest="app",
             metavar="{command} --help",
         )
-        self._collections()
-        self._config()
-        self._doc()
-        self._inventory()
-        self._load()
-        self._run()
+        # each subcommand is built by the method of the same name
+        for name in SUBCOMMANDS:
+            if not subcommands or name in subcommands:
+                getattr(self, f"_{name}")()
 
     def _add_subparser(self, name: str, desc: str) -> ArgumentParser:
         return self._subparsers.add_parser(
@@ -334,3 +341,23 @@ class CliArgs:
             help="Specify the navigator mode to run",
             type=str,
         )
+
+
+@lru_cache(maxsize=None)
+def _build_parser(app_name: str, subcommands: Tuple[str, ...]) -> ArgumentParser:
+    """build the parser for the app once and reuse it
+    for subsequent parses
+    """
+    return CliArgs(app_name, subcommands).parser
+
+
+def get_parser(app_name: str, params: Optional[List[str]] = None) -> ArgumentParser:
+    """get the parser for the app, only building the subcommand when it is
+    the first param. All subcommands are built otherwise, since an option's value
+    can't be told apart from a subcommand without parsing, or when help was
+    requested, so the help and invalid choice messages are complete.
+    """
+    subcommands: Tuple[str, ...] = ()
+    if params and params[0] in SUBCOMMANDS and "-h" not in params and "--help" not in params:
+        subcommands = (params[0],)
+    return _build_parser(app_name, subcommands)
@@ -4,9 +4,10 @@ Configuration subsystem for ansible-navigator
 import os
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 from typing import Dict
-from typing import List
+from typing import Sequence
 from typing import Tuple
 
 from .utils import Sentinel
@@ -22,8 +23,9 @@ from .utils import Sentinel
 
 def generate_editor_command():
     """generate a command for EDITOR is env var is set"""
-    if "EDITOR" in os.environ:
-        command = "%s {filename}" % os.environ.get("EDITOR")
+    editor = os.environ.get("EDITOR")
+    if editor is not None:
+        command = "%s {filename}" % editor
     else:
         command = "vi +{line_number} {filename}"
     return command
@@ -55,24 +57,25 @@ _DEFAULTS = {
 }
 
 # This maps argparse destination variables to config paths
+# the paths are tuples so they can't be changed by the code using them
 ROOT = "ansible-navigator"
 ARGPARSE_TO_CONFIG = {
-    "container_engine": [ROOT, "container-engine"],
-    "editor_command": [ROOT, "editor", "command"],
-    "editor_console": [ROOT, "editor", "console"],
-    "execution_environment_image": [ROOT, "execution-environment-image"],
-    "execution_environment": [ROOT, "execution-environment"],
-    "inventory_columns": [ROOT, "inventory-columns"],
-    "inventory": [ROOT, "inventory"],
-    "logfile": [ROOT, "log", "file"],
-    "loglevel": [ROOT, "log", "level"],
-    "mode": [ROOT, "mode"],
-    "no_osc4": [ROOT, "no-osc4"],
-    "pass_environment_variable": [ROOT, "pass-environment-variable"],
-    "playbook_artifact": [ROOT, "playbook-artifact"],
-    "playbook": [ROOT, "playbook"],
-    "set_environment_variable": [ROOT, "set-environment-variable"],
-    "type": [ROOT, "doc-plugin-type"],
+    "container_engine": (ROOT, "container-engine"),
+    "editor_command": (ROOT, "editor", "command"),
+    "editor_console": (ROOT, "editor", "console"),
+    "execution_environment_image": (ROOT, "execution-environment-image"),
+    "execution_environment": (ROOT, "execution-environment"),
+    "inventory_columns": (ROOT, "inventory-columns"),
+    "inventory": (ROOT, "inventory"),
+    "logfile": (ROOT, "log", "file"),
+    "loglevel": (ROOT, "log", "level"),
+    "mode": (ROOT, "mode"),
+    "no_osc4": (ROOT, "no-osc4"),
+    "pass_environment_variable": (ROOT, "pass-environment-variable"),
+    "playbook_artifact": (ROOT, "playbook-artifact"),
+    "playbook": (ROOT, "playbook"),
+    "set_environment_variable": (ROOT, "set-environment-variable"),
+    "type": (ROOT, "doc-plugin-type"),
 }
 
 
@@ -92,7 +95,9 @@ class NavigatorConfig:  # pylint: disable=too-few-public-methods
     def __init__(self, dct: Dict):
         self.config = dct
 
-    def get(self, keys: List[str], default: Any = Sentinel) -> Tuple[NavigatorConfigSource, Any]:
+    def get(
+        self, keys: Sequence[str], default: Any = Sentinel
+    ) -> Tuple[NavigatorConfigSource, Any]:
         """
         Takes a list of keys that correspond to nested keys in config.
         If the key is found in the config, return the value.
@@ -104,9 +109,8 @@ class NavigatorConfig:  # pylint: disable=too-few-public-methods
         """
         current = self.config
         for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
+            current = current.get(key, Sentinel) if isinstance(current, dict) else Sentinel
+            if current is Sentinel:
                 break
         else:
             return NavigatorConfigSource.USER_CFG, current
@@ -115,13 +119,34 @@ class NavigatorConfig:  # pylint: disable=too-few-public-methods
         if default is not Sentinel:
             return NavigatorConfigSource.ARGPARSE_DEFAULT, default
 
-        current = _DEFAULTS
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                break
-        else:
-            return NavigatorConfigSource.DEFAULT_CFG, current
+        return NavigatorConfigSource.DEFAULT_CFG, self.get_default(keys)
+
+    @staticmethod
+    def get_default(keys: Sequence[str]) -> Any:
+        """
+        Takes a list of keys that correspond to nested keys in the internal
+        default config [defined above] and returns the value.
+
+        If the key didn't match, throw KeyError.
+        """
+        return _get_default(tuple(keys))
 
-        raise KeyError(keys)
+
+@lru_cache(maxsize=None)
+def _get_default(keys: Tuple[str, ...]) -> Any:
+    """
+    Walk the internal default config, which doesn't change once loaded,
+    so each key path only needs to be walked once.
+    """
+    current: Any = _DEFAULTS
+    for key in keys:
+        current = current.get(key, Sentinel) if isinstance(current, dict) else Sentinel
+        if current is Sentinel:
+            raise KeyError(list(keys))
+    return current
+
+
+# The default for each argparse destination, looked up once for the help text
+ARGPARSE_DEFAULTS = {
+    dest: NavigatorConfig.get_default(path) for dest, path in ARGPARSE_TO_CONFIG.items()
+}
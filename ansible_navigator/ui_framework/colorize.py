@@ -28,6 +28,9 @@ CURSES_STYLES = {
     8: getattr(curses, "A_INVIS", None),
 }
 
+# The ansi 16 color foreground codes, mapped to their color number
+ANSI_16 = {code: idx for idx, code in enumerate(chain(range(30, 38), range(90, 98)))}
+
 THEME = "dark_vs.json"
 
 
@@ -78,7 +81,7 @@ class Colorize:
         self._load()
 
     def _load(self):
-        with open(os.path.join(self._theme_dir, THEME)) as data_file:
+        with open(os.path.join(self._theme_dir, THEME), encoding="utf-8") as data_file:
             self._schema = ColorSchema(json.load(data_file))
 
     @functools.lru_cache(maxsize=100)
@@ -279,12 +282,11 @@ def ansi_to_curses(line: str) -> CursesLine:
                     if two:
                         style = CURSES_STYLES.get(int(two), None) or 0
                 elif not cap["fg_action"]:
-                    ansi_16 = list(chain(range(30, 38), range(90, 98)))
                     if two is None:
-                        color = ansi_16.index(int(one)) if int(one) in ansi_16 else int(one)
+                        color = ANSI_16.get(int(one), int(one))
                         color = curses.color_pair(color % curses.COLORS)
                     else:
-                        color = ansi_16.index(int(two)) if int(two) in ansi_16 else int(two)
+                        color = ANSI_16.get(int(two), int(two))
                         color = curses.color_pair(color % curses.COLORS)
                         style = CURSES_STYLES.get(int(one), None) or 0
             else:
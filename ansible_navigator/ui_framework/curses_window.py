@@ -151,7 +151,7 @@ class CursesWindow:
         self._logger.debug("_custom_colors_enabled: %s", self._custom_colors_enabled)
 
         if self._custom_colors_enabled:
-            with open(os.path.join(self._theme_dir, DEFAULT_COLORS)) as data_file:
+            with open(os.path.join(self._theme_dir, DEFAULT_COLORS), encoding="utf-8") as data_file:
                 colors = json.load(data_file)
 
             for color_name, color_hex in colors.items():
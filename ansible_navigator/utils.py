@@ -11,10 +11,10 @@ import sys
 import sysconfig
 
 from distutils.spawn import find_executable
+from functools import lru_cache
 
 from typing import Any
 from typing import Dict
-from typing import Generator
 from typing import List
 from typing import Mapping
 from typing import Optional
@@ -67,15 +67,6 @@ def human_time(seconds: int) -> str:
     return "%s%ds" % (sign_string, seconds)
 
 
-def flatten_list(lyst: List) -> Generator:
-    """flatten a list of lists"""
-    for element in lyst:
-        if isinstance(element, list):
-            yield from flatten_list(element)
-        else:
-            yield element
-
-
 def to_list(thing: Union[str, List]) -> List:
     """convert something to a list if necessary"""
     if not isinstance(thing, list):
@@ -202,7 +193,7 @@ def env_var_is_file_path(env_var: str, kind: str) -> Tuple[Optional[str], List[s
         msgs.append(f"No {kind} file set by {env_var}")
     else:
         msgs.append(f"Found a {kind} file at {candidate_path} set by {env_var}")
-        if os.path.isfile(candidate_path) and os.path.exists(candidate_path):
+        if os.path.isfile(candidate_path):
             file_path = candidate_path
             msgs.append(f"{kind.capitalize()} file at {file_path} set by {env_var} is viable")
             exp_path = os.path.abspath(os.path.expanduser(file_path))
@@ -214,25 +205,30 @@ def env_var_is_file_path(env_var: str, kind: str) -> Tuple[Optional[str], List[s
     return file_path, msgs
 
 
-def _get_config_file(
-    path: str, filename: str, allowed_extensions: List, msgs: List
-) -> Optional[str]:
-    """check if filename is present in given path with allowed
-    extensions. If multiple files are present it throws an error
-    as only a single valid config file can be present in the
-    given path.
+def _get_config_file(path: str, valid_file_names: List[str], msgs: List) -> Optional[str]:
+    """check if one of the valid file names (the filename with
+    each allowed extension) is present in given path. If multiple files are
+    present it throws an error as only a single valid config file can be
+    present in the given path.
     """
     config_files_found = []
     config_file = None
-    valid_file_names = [
-        f"{filename}.{allowed_extension}" for allowed_extension in allowed_extensions
-    ]
+    # read the directory once, rather than checking for each file name
+    try:
+        dir_entries = set(os.listdir(path))
+    except PermissionError:
+        # listing needs read permission, checking for a name only needs search permission
+        dir_entries = {
+            name for name in valid_file_names if os.path.exists(os.path.join(path, name))
+        }
+    except OSError:
+        dir_entries = set()
     for name in valid_file_names:
-        candidate_config_path = os.path.join(path, name)
-        if not os.path.exists(candidate_config_path):
+        # a listed name may still be a dangling symlink
+        if name not in dir_entries or not os.path.exists(os.path.join(path, name)):
             msgs.append(f"Skipping {path}/{name} because it does not exist")
             continue
-        config_files_found.append(candidate_config_path)
+        config_files_found.append(os.path.join(path, name))
 
     if len(config_files_found) > 1:
         error_msg = "only one file among '{0}' should be present under" " directory '{1}'".format(
@@ -249,20 +245,9 @@ def _get_config_file(
     return config_file
 
 
-def get_conf_path(
-    filename: Optional[str] = None, allowed_extensions: Optional[List] = None
-) -> Tuple[Optional[str], List[str]]:
-    """
-    returns config dir (e.g. /etc/ansible-navigator) if filename is None and
-    config file path if filename provided. First found wins.
-    If a filename is given, ensures the file exists in the directory.
-
-    TODO: This is a pretty expensive function (lots of statting things on disk).
-          We should probably cache the potential paths somewhere, eventually.
-    """
-
+def _potential_conf_paths() -> Tuple[str, ...]:
+    """the directories searched for config, in order, first found wins"""
     potential_paths: List[str] = []
-    msgs: List[str] = []
 
     # .ansible-navigator of current direcotry
     potential_paths.append(".ansible-navigator")
@@ -285,13 +270,40 @@ def get_conf_path(
         path = os.path.join(prefix, "local", "etc", "ansible-navigator")
         potential_paths.append(path)
 
-    for path in potential_paths:
-        if allowed_extensions:
-            if not filename:
-                msg = f"allowed_extensions '{allowed_extensions}' requires filename to be set"
-                error_and_exit_early(msg)
+    return tuple(potential_paths)
+
+
+# These don't change for the life of the process, so only build them once
+POTENTIAL_CONF_PATHS = _potential_conf_paths()
+
+
+def get_conf_path(
+    filename: Optional[str] = None, allowed_extensions: Optional[List] = None
+) -> Tuple[Optional[str], List[str]]:
+    """
+    returns config dir (e.g. /etc/ansible-navigator) if filename is None and
+    config file path if filename provided. First found wins.
+    If a filename is given, ensures the file exists in the directory.
+
+    NOTE: This is a pretty expensive function (lots of statting things on disk),
+          the potential paths are built once, but each is still checked per call.
+    """
 
-            config_path = _get_config_file(path, filename, allowed_extensions, msgs)
+    msgs: List[str] = []
+
+    # the candidate file names are the same for every path, so build them once
+    valid_file_names: List[str] = []
+    if allowed_extensions:
+        if not filename:
+            msg = f"allowed_extensions '{allowed_extensions}' requires filename to be set"
+            error_and_exit_early(msg)
+        valid_file_names = [
+            f"{filename}.{allowed_extension}" for allowed_extension in allowed_extensions
+        ]
+
+    for path in POTENTIAL_CONF_PATHS:
+        if valid_file_names:
+            config_path = _get_config_file(path, valid_file_names, msgs)
             if config_path is None:
                 continue
         else:
@@ -357,13 +369,19 @@ def get_and_check_collection_doc_cache(args, collection_doc_cache_fname: str) ->
     return messages, collection_cache
 
 
-def _get_kvs(args, collection_doc_cache_path):
-    spec = importlib.util.spec_from_file_location(
-        "kvs", f"{args.share_dir}/utils/key_value_store.py"
-    )
+@lru_cache(maxsize=None)
+def _load_kvs_module(share_dir):
+    """load the key value store module shipped in the share dir,
+    it only needs to be executed once per share dir
+    """
+    spec = importlib.util.spec_from_file_location("kvs", f"{share_dir}/utils/key_value_store.py")
     mod = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(mod)
-    return mod.KeyValueStore(collection_doc_cache_path)
+    return mod
+
+
+def _get_kvs(args, collection_doc_cache_path):
+    return _load_kvs_module(args.share_dir).KeyValueStore(collection_doc_cache_path)
 
 
 def error_and_exit_early(msg) -> NoReturn:
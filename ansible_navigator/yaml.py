@@ -9,7 +9,10 @@ except ImportError:
 
 try:
     from yaml import CLoader as Loader
-    from yaml import CSafeLoader as SafeLoader
 except ImportError:
     from yaml import Loader  # type: ignore # noqa: F401
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
     from yaml import SafeLoader  # type: ignore # noqa: F401
@@ -1,7 +1,12 @@
 """ tests for cli
 """
+import logging
+import os
+
 import pytest
 
+from argparse import Namespace
+
 import ansible_navigator.cli as cli
 
 from ..defaults import FIXTURES_DIR
@@ -66,6 +71,11 @@ from ..defaults import FIXTURES_DIR
             "playbook",
             "/site.yaml",
         ),
+        (
+            ["run", "/site.yaml", "--senv", "FOO=a=b", "--senv", "BAR="],
+            "set_environment_variable",
+            {"FOO": "a=b", "BAR": ""},
+        ),
     ],
     ids=[
         "commandline overrides config file value",
@@ -80,6 +90,7 @@ from ..defaults import FIXTURES_DIR
         "multiple inventory",
         "run and multiple inventory",
         "run, check playbook",
+        "set environment variable values containing =",
     ],
 )
 # pylint:disable=redefined-outer-name
@@ -99,3 +110,246 @@ def test_editor_command_default(monkeypatch):
     )
     _pre_logger_msgs, args = cli.parse_and_update([])
     assert args.editor_command == "vi +{line_number} {filename}"
+
+
+def test_config_reused(monkeypatch, tmp_path):
+    """test the parsed config is reused and invalidated when the file changes"""
+    monkeypatch.setattr(cli, "_LOADED_CONFIG", {})
+    config_file = tmp_path / "ansible-navigator.yml"
+    config_file.write_text("ansible-navigator:\n  mode: stdout\n")
+
+    # pylint: disable=protected-access
+    msgs, config = cli._load_config_file_cached(str(config_file))
+    assert config == {"ansible-navigator": {"mode": "stdout"}}
+    assert not any(msg.startswith("Using config already loaded") for msg, _msg_args in msgs)
+
+    msgs, config = cli._load_config_file_cached(str(config_file))
+    assert config == {"ansible-navigator": {"mode": "stdout"}}
+    assert any(msg.startswith("Using config already loaded") for msg, _msg_args in msgs)
+
+    config_file.write_text("ansible-navigator:\n  mode: interactive\n")
+    msgs, config = cli._load_config_file_cached(str(config_file))
+    assert config == {"ansible-navigator": {"mode": "interactive"}}
+    assert not any(msg.startswith("Using config already loaded") for msg, _msg_args in msgs)
+
+
+def test_error_cb_not_kept_on_shared_parser(monkeypatch):
+    """test an error callback doesn't leak into later parses"""
+    monkeypatch.setenv(
+        "ANSIBLE_NAVIGATOR_CONFIG", f"{FIXTURES_DIR}/unit/cli/ansible-navigator_empty.yml"
+    )
+    cli.parse_and_update(["config"], error_cb=lambda message: None)
+    parser = cli.get_parser(cli.APP_NAME, ["config"])
+    assert "error" not in vars(parser)
+
+
+def test_invalid_subcommand_lists_all(monkeypatch):
+    """test an invalid subcommand is reported with every valid choice"""
+    monkeypatch.setenv(
+        "ANSIBLE_NAVIGATOR_CONFIG", f"{FIXTURES_DIR}/unit/cli/ansible-navigator_empty.yml"
+    )
+    messages = []
+
+    def error_cb(message):
+        messages.append(message)
+        raise SystemExit(2)
+
+    with pytest.raises(SystemExit):
+        cli.parse_and_update(["bogus", "config"], error_cb=error_cb)
+    assert len(messages) == 1
+    assert "invalid choice: 'bogus'" in messages[0]
+    for subcommand in ("collections", "config", "doc", "inventory", "load", "run"):
+        assert subcommand in messages[0]
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("~", "/home/user"),
+        ("~/inventory.yaml", "/home/user/inventory.yaml"),
+        ("inventory/../hosts.yaml", "/cwd/hosts.yaml"),
+        ("/etc//ansible/hosts", "/etc/ansible/hosts"),
+    ],
+    ids=["home", "in home", "relative", "absolute"],
+)
+def test_abs_user_path(monkeypatch, path, expected):
+    """test paths are expanded and made absolute like abspath(expanduser())"""
+    monkeypatch.setattr(cli, "_HOME", "/home/user")
+    # pylint: disable=protected-access
+    assert cli._abs_user_path(path, "/cwd") == expected
+
+
+def test_set_environment_variable_from_config(monkeypatch, tmp_path):
+    """test set environment variable values from the config become strings"""
+    config_file = tmp_path / "ansible-navigator.yml"
+    config_file.write_text(
+        "ansible-navigator:\n"
+        "  set-environment-variable:\n"
+        "    TEST_STR: navigator\n"
+        "    TEST_BOOL: true\n"
+        "    TEST_INT: 42\n"
+        "    TEST_LIST: [1, 2]\n"
+    )
+    monkeypatch.setenv("ANSIBLE_NAVIGATOR_CONFIG", str(config_file))
+    _pre_logger_msgs, args = cli.parse_and_update(["run", "/site.yaml"])
+    assert args.set_environment_variable == {
+        "TEST_STR": "navigator",
+        "TEST_BOOL": "true",
+        "TEST_INT": "42",
+        "TEST_LIST": "[1, 2]",
+    }
+
+
+def test_running_with_messages_upper_case_debug(monkeypatch, tmp_path):
+    """test the args are logged when the settings file log level is upper case"""
+    config_file = tmp_path / "ansible-navigator.yml"
+    config_file.write_text("ansible-navigator:\n  log:\n    level: DEBUG\n")
+    monkeypatch.setenv("ANSIBLE_NAVIGATOR_CONFIG", str(config_file))
+    msgs, args = cli.parse_and_update(["config"])
+    assert args.loglevel == "DEBUG"
+    assert any(msg.startswith("Running with") for msg, _msg_args in msgs)
+
+
+def test_running_with_messages_reparse(monkeypatch):
+    """test the args are logged on a reparse when the logger is already at debug"""
+    monkeypatch.delenv("ANSIBLE_NAVIGATOR_CONFIG", raising=False)
+    level = cli.logger.level
+    # set through setLevel, so the logger's enabled level cache is cleared
+    cli.logger.setLevel(logging.DEBUG)
+    try:
+        msgs, args = cli.parse_and_update(["config", "--ll", "info"])
+    finally:
+        cli.logger.setLevel(level)
+    assert args.loglevel == "info"
+    assert any(msg.startswith("Running with") for msg, _msg_args in msgs)
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([cli.Sentinel, ["a"], ["b", "c"]], ["a", "b", "c"]),
+        (["a", "b"], ["a", "b"]),
+        ([cli.Sentinel], []),
+    ],
+    ids=["from the command line", "from the settings file", "not set"],
+)
+def test_flatten_args(values, expected):
+    """test append args are flattened and the Sentinel removed"""
+    # pylint: disable=protected-access
+    assert cli._flatten_args(values, "inventory") == expected
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [("inventory", "hosts.yml"), ("pass-environment-variable", "FOO")],
+    ids=["inventory", "pass environment variable"],
+)
+def test_list_setting_not_a_list(monkeypatch, tmp_path, capsys, setting, value):
+    """test a list setting given as a string in the settings file is reported"""
+    config_file = tmp_path / "ansible-navigator.yml"
+    config_file.write_text(f"ansible-navigator:\n  {setting}: {value}\n")
+    monkeypatch.setenv("ANSIBLE_NAVIGATOR_CONFIG", str(config_file))
+    with pytest.raises(SystemExit):
+        cli.parse_and_update(["run", "/site.yaml"])
+    assert f"The '{setting}' setting must be a list, found str '{value}'" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("level", ["WARN", "fatal", "notset", "Critical"])
+def test_log_levels(level):
+    """test every level name the logging module accepts is available"""
+    assert cli.LOG_LEVELS[level.lower()] == getattr(logging, level.upper())
+
+
+def test_setup_logger_unknown_level(tmp_path):
+    """test an unknown log level is reported rather than raising"""
+    args = Namespace(logfile=str(tmp_path / "navigator.log"), loglevel="verbose")
+    with pytest.raises(SystemExit):
+        cli.setup_logger(args)
+    assert not (tmp_path / "navigator.log").exists()
+
+
+def test_load_missing_artifact(monkeypatch):
+    """test a missing artifact is reported through the parser"""
+    monkeypatch.setenv(
+        "ANSIBLE_NAVIGATOR_CONFIG", f"{FIXTURES_DIR}/unit/cli/ansible-navigator_empty.yml"
+    )
+    messages = []
+    cli.parse_and_update(["load", "/does/not/exist.json"], error_cb=messages.append)
+    assert messages == ["The file specified with load could not be found. /does/not/exist.json"]
+
+
+def test_setup_config_env_var_skips_search(monkeypatch):
+    """test the search path isn't checked when the config is set by env var"""
+    monkeypatch.setenv(
+        "ANSIBLE_NAVIGATOR_CONFIG", f"{FIXTURES_DIR}/unit/cli/ansible-navigator_empty.yml"
+    )
+
+    def get_conf_path(*_args, **_kwargs):
+        raise AssertionError("get_conf_path should not be called")
+
+    monkeypatch.setattr(cli, "get_conf_path", get_conf_path)
+    msgs, _config = cli.setup_config()
+    assert (
+        "Using config file at %s set by %s",
+        (
+            f"{FIXTURES_DIR}/unit/cli/ansible-navigator_empty.yml",
+            "ANSIBLE_NAVIGATOR_CONFIG",
+        ),
+    ) in msgs
+
+
+def test_find_config_path_kept(monkeypatch, tmp_path):
+    """test the search path is only checked once per working directory"""
+    monkeypatch.delenv("ANSIBLE_NAVIGATOR_CONFIG", raising=False)
+    monkeypatch.setattr(cli, "_FOUND_CONFIG_PATHS", {})
+    config_file = tmp_path / "ansible-navigator.yml"
+    config_file.write_text("ansible-navigator:\n  mode: stdout\n")
+    calls = []
+
+    def get_conf_path(*_args, **_kwargs):
+        calls.append(os.getcwd())
+        return str(config_file), ["Skipping"]
+
+    monkeypatch.setattr(cli, "get_conf_path", get_conf_path)
+    cli.setup_config()
+    msgs, _config = cli.setup_config()
+    assert calls == [os.getcwd()]
+    assert ("Skipping", ()) in msgs
+
+
+def test_find_config_path_created(monkeypatch, tmp_path):
+    """test a config file created after none was found is picked up"""
+    monkeypatch.delenv("ANSIBLE_NAVIGATOR_CONFIG", raising=False)
+    monkeypatch.setattr(cli, "_FOUND_CONFIG_PATHS", {})
+    monkeypatch.chdir(tmp_path)
+
+    _msgs, config = cli.setup_config()
+    assert config.config == {}
+
+    config_file = tmp_path / ".ansible-navigator" / "ansible-navigator.yml"
+    config_file.parent.mkdir()
+    config_file.write_text("ansible-navigator:\n  mode: stdout\n")
+    _msgs, config = cli.setup_config()
+    assert config.config == {"ansible-navigator": {"mode": "stdout"}}
+
+
+def test_find_config_path_removed(monkeypatch, tmp_path):
+    """test a config file removed after it was found falls back to defaults"""
+    monkeypatch.delenv("ANSIBLE_NAVIGATOR_CONFIG", raising=False)
+    monkeypatch.setattr(cli, "_FOUND_CONFIG_PATHS", {})
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / ".ansible-navigator" / "ansible-navigator.yml"
+    config_file.parent.mkdir()
+    config_file.write_text("ansible-navigator:\n  mode: stdout\n")
+
+    _msgs, config = cli.setup_config()
+    assert config.config == {"ansible-navigator": {"mode": "stdout"}}
+
+    config_file.unlink()
+    _msgs, config = cli.setup_config()
+    assert config.config == {}
+
+    # found, but removed before it could be loaded
+    monkeypatch.setattr(cli, "_find_config_path", lambda: (str(config_file), ()))
+    _msgs, config = cli.setup_config()
+    assert config.config == {}
@@ -0,0 +1,65 @@
+""" tests for cli_args
+"""
+from argparse import ArgumentTypeError
+
+import pytest
+
+from ansible_navigator.cli_args import get_parser
+from ansible_navigator.cli_args import str2bool
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (True, True),
+        ("Yes", True),
+        ("on", True),
+        ("FALSE", False),
+        ("0", False),
+    ],
+    ids=["bool", "mixed case yes", "on", "upper case false", "zero"],
+)
+def test_str2bool(value, expected):
+    """test common values are converted to a boolean"""
+    assert str2bool(value) is expected
+
+
+@pytest.mark.parametrize("value", ["maybe", 1], ids=["unknown string", "not a string"])
+def test_str2bool_invalid(value):
+    """test anything else is rejected"""
+    with pytest.raises(ArgumentTypeError):
+        str2bool(value)
+
+
+ALL_SUBCOMMANDS = ["collections", "config", "doc", "inventory", "load", "run"]
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        (["config"], ["config"]),
+        (["run", "site.yaml", "-i", "hosts.yaml"], ["run"]),
+        (["-m", "stdout", "run", "site.yaml"], ALL_SUBCOMMANDS),
+        (["--eei", "run", "config"], ALL_SUBCOMMANDS),
+        (["--ecmd", "run", "bogus"], ALL_SUBCOMMANDS),
+        (["bogus", "config"], ALL_SUBCOMMANDS),
+        ([], ALL_SUBCOMMANDS),
+        (["run", "--help"], ALL_SUBCOMMANDS),
+    ],
+    ids=[
+        "only the subcommand given",
+        "subcommand first",
+        "option value first, all",
+        "option value is a subcommand name, all",
+        "option value is a subcommand name, unknown subcommand, all",
+        "unknown subcommand, all",
+        "no subcommand, all",
+        "help, all",
+    ],
+)
+def test_get_parser_subcommands(params, expected):
+    """test only the needed subcommands are built"""
+    parser = get_parser("ansible_navigator", params)
+    # pylint: disable=protected-access
+    subparsers = parser._subparsers._group_actions[0]  # type: ignore
+    assert sorted(subparsers.choices) == expected
@@ -88,3 +88,12 @@ def test_config_get_keyerror(dct, keys, default, expected):
     with expected:
         cfg = NavigatorConfig(dct)
         assert cfg.get(keys, default)
+
+
+def test_config_get_default():
+    """
+    Test that the internal defaults can be looked up without an instance.
+    """
+    assert NavigatorConfig.get_default(["ansible-navigator", "log", "level"]) == "info"
+    with pytest.raises(KeyError):
+        NavigatorConfig.get_default(["ansible-navigator", "log", "doesnotexist"])
@@ -11,38 +11,22 @@ from types import SimpleNamespace
 import ansible_navigator.utils as utils
 
 
-@pytest.mark.parametrize(
-    "value, anticpated_result",
-    [
-        ([1, 2, 3], [1, 2, 3]),
-        ([1, 2, [3]], [1, 2, 3]),
-        ([1, [2], [3, 4], 5, True, {6: False}], [1, 2, 3, 4, 5, True, {6: False}]),
-    ],
-    ids=[
-        "simple",
-        "list with one list",
-        "list detailed",
-    ],
-)
-def test_flatten_list(value: List, anticpated_result: List) -> None:
-    """test for flatten list"""
-    actual_result = utils.flatten_list(value)
-    assert list(actual_result) == anticpated_result
-
-
 def test_get_conf_path_allowed_extension_failed(monkeypatch) -> None:
     """test get_conf_path"""
 
+    def list_dir(arg):
+        if arg == "/etc/ansible-navigator":
+            return [
+                "ansible-navigator.yaml",
+                "ansible-navigator.yml",
+                "ansible-navigator.json",
+            ]
+        raise FileNotFoundError(arg)
+
     def check_path_exists(arg):
-        if arg in [
-            "/etc/ansible-navigator/ansible-navigator.yaml",
-            "/etc/ansible-navigator/ansible-navigator.yml",
-            "/etc/ansible-navigator/ansible-navigator.json",
-        ]:
-            return True
-        else:
-            return False
+        return os.path.dirname(arg) == "/etc/ansible-navigator"
 
+    monkeypatch.setattr(os, "listdir", list_dir)
     monkeypatch.setattr(os.path, "exists", check_path_exists)
 
     error_msg = (
@@ -65,17 +49,16 @@ def test_get_conf_path_allowed_extension_passed(monkeypatch) -> None:
         "~/.config/ansible-navigator/ansible-navigator.yaml"
     )
 
-    def check_path_exists(arg):
-        if arg == expected_config_file_path:
-            return True
-        else:
-            return False
+    def list_dir(arg):
+        if arg == os.path.dirname(expected_config_file_path):
+            return [os.path.basename(expected_config_file_path)]
+        raise FileNotFoundError(arg)
 
     def get_dir_permission(arg):
         if arg == os.path.dirname(expected_config_file_path):
             return SimpleNamespace(**{"st_mode": stat.S_IROTH})
 
-    monkeypatch.setattr(os.path, "exists", check_path_exists)
+    monkeypatch.setattr(os, "listdir", list_dir)
     monkeypatch.setattr(os, "stat", get_dir_permission)
 
     received_config_file_path, msgs = utils.get_conf_path(
@@ -87,6 +70,50 @@ def test_get_conf_path_allowed_extension_passed(monkeypatch) -> None:
     assert log_msg in msgs
 
 
+def test_get_conf_path_unreadable_dir(monkeypatch) -> None:
+    """test get_conf_path with a directory that can be searched but not listed"""
+
+    expected_config_file_path = "/etc/ansible-navigator/ansible-navigator.yml"
+
+    def list_dir(arg):
+        if arg == os.path.dirname(expected_config_file_path):
+            raise PermissionError(arg)
+        raise FileNotFoundError(arg)
+
+    def path_exists(arg):
+        return arg == expected_config_file_path
+
+    def get_dir_permission(arg):
+        if arg == os.path.dirname(expected_config_file_path):
+            return SimpleNamespace(**{"st_mode": stat.S_IXOTH})
+        raise FileNotFoundError(arg)
+
+    monkeypatch.setattr(os, "listdir", list_dir)
+    monkeypatch.setattr(os.path, "exists", path_exists)
+    monkeypatch.setattr(os, "stat", get_dir_permission)
+
+    received_config_file_path, _msgs = utils.get_conf_path(
+        "ansible-navigator", allowed_extensions=["json", "yaml", "yml"]
+    )
+
+    assert received_config_file_path == expected_config_file_path
+
+
+def test_get_config_file_dangling_symlink(tmp_path) -> None:
+    """test _get_config_file skips a listed name that is a dangling symlink"""
+
+    valid_file_names = ["ansible-navigator.json", "ansible-navigator.yml"]
+    os.symlink(tmp_path / "missing.json", tmp_path / "ansible-navigator.json")
+    expected_config_file_path = tmp_path / "ansible-navigator.yml"
+    expected_config_file_path.write_text("ansible-navigator: {}")
+
+    msgs: List[str] = []
+    received_config_file_path = utils._get_config_file(str(tmp_path), valid_file_names, msgs)
+
+    assert received_config_file_path == str(expected_config_file_path)
+    assert f"Skipping {tmp_path}/ansible-navigator.json because it does not exist" in msgs
+
+
 @pytest.mark.parametrize(
     "set_env, file_path, anticpated_result",
     [